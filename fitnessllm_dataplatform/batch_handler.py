@@ -65,7 +65,7 @@ class BatchHandler:
         fields = {
             "exception": str(e),
             "exception_type": type(e).__name__,
-            "traceback": traceback.format_exc(),
+            "traceback": "".join(traceback.format_exception(e)),
         }
         return fields
 
@@ -108,6 +108,21 @@ class BatchHandler:
         )
         return user_stream.get().to_dict()
 
+    @beartype
+    def refresh_user_token(self, uid: str, data_source: FitnessLLMDataSource) -> None:
+        """Refreshes a user's access token for a data source.
+
+        Args:
+            uid (str): The unique identifier of the user in Firestore.
+            data_source (FitnessLLMDataSource): The data source to refresh the token of.
+
+        Raises:
+            KeyError: If the refresh token is missing in the user's stream data.
+        """
+        refresh_function = REFRESH_FUNCTION_MAPPING[data_source.value]
+        stream_data = self.get_user_stream_data(uid=uid, data_source=data_source)
+        refresh_function(db=self.db, uid=uid, refresh_token=stream_data["refreshToken"])
+
     @beartype
     def process_user(
         self,
@@ -142,11 +157,7 @@ class BatchHandler:
                 data_source=data_source.value,
                 service="batch_handler",
             )
-            refresh_function = REFRESH_FUNCTION_MAPPING[data_source.value]
-            strava_data = self.get_user_stream_data(uid=uid, data_source=data_source)
-            refresh_function(
-                db=self.db, uid=uid, refresh_token=strava_data["refreshToken"]
-            )
+            self.refresh_user_token(uid=uid, data_source=data_source)
 
             process_user = ProcessUser(uid=uid, data_source=data_source.value)
             process_user.full_etl()
@@ -181,10 +192,11 @@ class BatchHandler:
     ) -> None:
         """Processes all users in the database for a specified data source.
 
-        This method retrieves all user documents from the Firestore database,
-        iterates through each user, and processes their data using the specified
-        data source. Logs are generated to track the progress and handle any
-        issues encountered during processing.
+        This method retrieves all user documents from the Firestore database and
+        refreshes each user's token. Users whose token was refreshed are then run
+        through ProcessUser.batch, which rebuilds silver once for all of them.
+        Logs are generated to track the progress and handle any issues
+        encountered during processing.
 
         Args:
             data_source (FitnessLLMDataSource): The data source to process for all users.
@@ -192,6 +204,10 @@ class BatchHandler:
 
         Returns:
             None
+
+        Raises:
+            Exception: The first error raised by ProcessUser.batch, so the job
+                fails when a user or the silver rebuild failed.
         """
         users = self.get_all_users()
         structured_logger.info(
@@ -203,6 +219,7 @@ class BatchHandler:
             service="batch_handler",
         )
         # TODO: Need to add that if nothing is given to datasource, that for each user we run for all their datasources.
+        uids = []
         for user in users:
             uid = user.get("uid")
             if not uid:
@@ -214,7 +231,7 @@ class BatchHandler:
                 continue
 
             try:
-                self.process_user(uid=uid, data_source=data_source)
+                self.refresh_user_token(uid=uid, data_source=data_source)
             except Exception as e:
                 structured_logger.error(
                     message="Error processing user",
@@ -224,6 +241,9 @@ class BatchHandler:
                     service="batch_handler",
                 )
                 continue
+            uids.append(uid)
+        if uids:
+            ProcessUser.batch(uids=uids, data_source=data_source.value)
         structured_logger.info(
             message="Finished processing all users",
             data_source=data_source.value,
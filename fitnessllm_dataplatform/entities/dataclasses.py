@@ -1,6 +1,6 @@
 """Dataclasses for the entities in the FitnessLLM Data Platform."""
 
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass, fields
 from datetime import datetime
 
 from beartype.typing import Optional
@@ -36,9 +36,9 @@ class Metrics:
 
     def as_dict(self):
         """Converts dataclass to dict."""
-        return asdict(
-            self, dict_factory=lambda x: {k: dataclass_convertor(v) for k, v in x}
-        )
+        return {
+            name: dataclass_convertor(getattr(self, name)) for name in METRICS_FIELDS
+        }
 
     def update(self, **kwargs):
         """Updates dataclass attributes."""
@@ -48,3 +48,7 @@ class Metrics:
             else:
                 raise AttributeError(f"{key} is not a valid attribute of Metrics")
         return self
+
+
+# Metrics only holds flat values, so as_dict can skip asdict's recursive copy.
+METRICS_FIELDS = tuple(field.name for field in fields(Metrics))
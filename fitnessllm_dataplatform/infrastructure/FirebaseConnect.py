@@ -11,7 +11,12 @@ class FirebaseConnect:
     def __init__(self, uid):
         """Init function."""
         self.uid = uid
-        self.app = firebase_admin.initialize_app()
+        # Batch runs connect once per user, but the default app can only be
+        # initialized once per process.
+        try:
+            self.app = firebase_admin.get_app()
+        except ValueError:
+            self.app = firebase_admin.initialize_app()
         self.open_connection()
 
     def open_connection(self):
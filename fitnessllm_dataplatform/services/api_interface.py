@@ -39,6 +39,6 @@ class APIInterface:
         fields = {
             "exception": str(e),
             "exception_type": type(e).__name__,
-            "traceback": traceback.format_exc(),
+            "traceback": "".join(traceback.format_exception(e)),
         }
         return fields
@@ -1,6 +1,7 @@
 """ETL Interface for Fitness LLM Data Platform."""
 
 import traceback
+from functools import lru_cache
 from os import environ
 
 from google.cloud import bigquery
@@ -8,6 +9,15 @@ from google.cloud import bigquery
 from fitnessllm_dataplatform.entities.enums import FitnessLLMDataSource
 
 
+@lru_cache(maxsize=1)
+def get_bigquery_client() -> bigquery.Client:
+    """Returns a BigQuery client shared by every ETL interface in the process.
+
+    Reusing it keeps credentials and HTTP connections warm across users.
+    """
+    return bigquery.Client()
+
+
 class ETLInterface:
     """ETL Interface for Fitness LLM Data Platform."""
 
@@ -17,7 +27,7 @@ class ETLInterface:
 
     def __init__(self):
         """Initializes ETL Interface."""
-        self.client = bigquery.Client()
+        self.client = get_bigquery_client()
         self.ENV = environ.get("ENV", "dev")
 
     def _get_common_fields(self) -> dict:
@@ -43,6 +53,6 @@ class ETLInterface:
         fields = {
             "exception": str(e),
             "exception_type": type(e).__name__,
-            "traceback": traceback.format_exc(),
+            "traceback": "".join(traceback.format_exception(e)),
         }
         return fields
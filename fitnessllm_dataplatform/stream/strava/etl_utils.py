@@ -1,5 +1,6 @@
 """Utility functions for ETL operations on Strava data."""
 
+import numpy as np
 from beartype import beartype
 from beartype.typing import Callable
 from pandas import DataFrame
@@ -10,8 +11,9 @@ from fitnessllm_dataplatform.stream.strava.entities.enums import StravaStreams
 @beartype
 def latlng_etl(df: DataFrame) -> DataFrame:
     """ETL operations for latlng data stream."""
-    df["latitude"] = df["data"].apply(lambda x: x[0])
-    df["longitude"] = df["data"].apply(lambda x: x[1])
+    coordinates = np.asarray(df["data"].tolist(), dtype=np.float64).reshape(-1, 2)
+    df["latitude"] = coordinates[:, 0]
+    df["longitude"] = coordinates[:, 1]
     df.drop(columns=["data"], inplace=True)
     return df
 
@@ -27,6 +29,37 @@ def activity_etl(df: DataFrame) -> DataFrame:
     return df
 
 
+def _flatten_nested(data: dict, prefix: str, separator: str, flat: dict) -> dict:
+    """Recursively writes nested keys of a JSON record into flat."""
+    for key, value in data.items():
+        flat_key = f"{prefix}{separator}{key}"
+        if isinstance(value, dict):
+            _flatten_nested(value, flat_key, separator, flat)
+        else:
+            flat[flat_key] = value
+    return flat
+
+
+def flatten_json(data: dict, separator: str = ".") -> dict:
+    """Flattens a single JSON record into a one level dict.
+
+    This produces the same keys and ordering as pd.json_normalize does for a
+    single record, without its generic record path handling.
+
+    Args:
+        data: The JSON record to flatten.
+        separator: The separator used to join nested keys.
+
+    Returns:
+        Dict of flattened keys and values.
+    """
+    flat = {key: value for key, value in data.items() if not isinstance(value, dict)}
+    for key, value in data.items():
+        if isinstance(value, dict):
+            _flatten_nested(value, str(key), separator, flat)
+    return flat
+
+
 def get_etl_func(stream: StravaStreams) -> list[Callable]:
     """Returns the ETL function for a given stream."""
     return ETL_MAP.get(stream, [])
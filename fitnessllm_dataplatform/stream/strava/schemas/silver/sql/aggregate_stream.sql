@@ -30,7 +30,4 @@ left join {{ schema }}.power p on t.athlete_id = p.athlete_id and t.activity_id
 left join {{ schema }}.temp temp on t.athlete_id = temp.athlete_id and t.activity_id = temp.activity_id and t.index = temp.index
 left join {{ schema }}.velocity_smooth vs on t.athlete_id = vs.athlete_id and t.activity_id = vs.activity_id and t.index = vs.index
 left join {{ schema }}.watts w on t.athlete_id = w.athlete_id and t.activity_id = w.activity_id and t.index = w.index
-where t.athlete_id = '{{ athlete_id }}'
-{% if activity_id %}
-and t.activity_id = '{{ activity_id }}'
-{% endif %}
+where t.athlete_id in unnest(@athlete_ids)
@@ -1,20 +1,21 @@
 """ETL Interface for Strava data."""
 
-import itertools
 import json
-import tempfile
+import re
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from enum import EnumType
-from functools import partial
+from functools import cached_property, partial
 from os import environ
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 
 import numpy as np
-import pandas as pd
 from beartype import beartype
 from cloudpathlib import GSPath
 from fitnessllm_shared.logger_utils import structured_logger
 from google.cloud import bigquery
+from google.cloud.bigquery_storage_v1 import BigQueryWriteClient
 from joblib import Parallel, delayed
 from joblib._multiprocessing_helpers import mp
 from pandas import DataFrame
@@ -29,9 +30,19 @@ from fitnessllm_dataplatform.stream.strava.entities.enums import StravaStreams
 from fitnessllm_dataplatform.stream.strava.entities.queries import (
     create_activities_query,
 )
-from fitnessllm_dataplatform.stream.strava.etl_utils import execute_etl_func
+from fitnessllm_dataplatform.stream.strava.etl_utils import (
+    execute_etl_func,
+    flatten_json,
+)
+from fitnessllm_dataplatform.utils.cloud_utils import GCS_CONCURRENCY
+from fitnessllm_dataplatform.utils.storage_write_utils import (
+    append_rows,
+    to_epoch_micros,
+)
 from fitnessllm_dataplatform.utils.task_utils import load_schema_from_json
 
+COLUMN_NAME_PATTERN = re.compile(r"[^a-zA-Z0-9_]")
+
 
 class BronzeStravaETLInterface(ETLInterface):
     """ETL Interface for Strava data.
@@ -82,6 +93,8 @@ class BronzeStravaETLInterface(ETLInterface):
             bucket=self.InfrastructureNames.bronze_bucket,
             athlete_id=athlete_id,
         )
+        self.write_client = BigQueryWriteClient()
+        self._pending_metrics: defaultdict[str, list[dict]] = defaultdict(list)
 
     @beartype
     def _get_common_fields(self) -> dict[str, str]:
@@ -89,6 +102,20 @@ class BronzeStravaETLInterface(ETLInterface):
         fields.update({"athlete_id": self.athlete_id})
         return fields
 
+    @cached_property
+    def _listing(self) -> dict[str, list[GSPath]]:
+        """Lists the athlete's bronze files once, grouped by stream folder.
+
+        A single recursive listing replaces one paginated LIST call per stream.
+        Streams excluded by data_streams are dropped here.
+        """
+        listing = defaultdict(list)
+        for file in self.partial_strava_storage(strava_model=None).rglob("*.json"):
+            stream_name = file.parent.name
+            if not self.data_streams or stream_name in self.data_streams:
+                listing[stream_name].append(file)
+        return dict(listing)
+
     @beartype
     def load_json_into_bq(self) -> None:
         """Loads JSON files into BigQuery.
@@ -98,45 +125,67 @@ class BronzeStravaETLInterface(ETLInterface):
         into BigQuery. If no new data is found, a warning is logged.
 
         Raises:
-            KeyError: If the specified data streams are not found.
+            KeyError: If the user defined data streams are not Strava streams.
         """
-        try:
-            streams = [
-                StravaStreams[element.name.upper()]
-                for element in self.partial_strava_storage(strava_model=None).iterdir()
-            ]
-        except KeyError as e:
-            structured_logger.error(
-                message="User defined data_streams not found",
-                **self._get_common_fields(),
-                **self._get_exception_fields(e),
-            )
-            raise e
-
         if self.data_streams:
-            streams = [
-                stream for stream in streams if stream.value in self.data_streams
-            ]
-
-        for stream in streams:
-            structured_logger.info(
-                message="Loading stream for athlete_id",
-                stream=stream.value,
-                **self._get_common_fields(),
-            )
-            dataframes, metrics = self.convert_stream_json_to_dataframe(stream=stream)
-            if dataframes and metrics:
-                self.upsert_to_bigquery(
-                    stream=stream,
-                    dataframes=dataframes,
-                    metrics=metrics,
-                )
-            else:
-                structured_logger.warning(
-                    message="No new data",
-                    stream=stream.value,
+            try:
+                streams = [
+                    StravaStreams[stream_name.upper()]
+                    for stream_name in self.data_streams
+                ]
+            except KeyError as e:
+                structured_logger.error(
+                    message="User defined data_streams not found",
                     **self._get_common_fields(),
+                    **self._get_exception_fields(e),
                 )
+                raise e
+        else:
+            streams = []
+            for stream_name in self._listing:
+                if stream_name.upper() not in StravaStreams.__members__:
+                    structured_logger.warning(
+                        message="Skipping unknown stream folder",
+                        stream=stream_name,
+                        **self._get_common_fields(),
+                    )
+                    continue
+                streams.append(StravaStreams[stream_name.upper()])
+
+        # Converting a stream already saturates the download threads and the
+        # process pool, so streams are converted one at a time. Each upload runs
+        # in the background while the next stream is converted.
+        uploads = []
+        try:
+            with ThreadPoolExecutor(max_workers=1) as uploader:
+                for stream in streams:
+                    structured_logger.info(
+                        message="Loading stream for athlete_id",
+                        stream=stream.value,
+                        **self._get_common_fields(),
+                    )
+                    dataframes, metrics = self.convert_stream_json_to_dataframe(
+                        stream=stream
+                    )
+                    if dataframes and metrics:
+                        uploads.append(
+                            uploader.submit(
+                                self.upsert_to_bigquery,
+                                stream=stream,
+                                dataframes=dataframes,
+                                metrics=metrics,
+                            )
+                        )
+                    else:
+                        structured_logger.warning(
+                            message="No new data",
+                            stream=stream.value,
+                            **self._get_common_fields(),
+                        )
+            for upload in uploads:
+                upload.result()
+        finally:
+            self.flush_metrics()
 
     @beartype
     def convert_stream_json_to_dataframe(self, stream: StravaStreams):
@@ -159,18 +208,17 @@ class BronzeStravaETLInterface(ETLInterface):
             KeyError: If the data stream is not found in the storage path.
         """
         sample = environ.get("SAMPLE")
-        activity_ids = (
-            self.client.query(
+        activity_ids = {
+            str(row["activity_id"])
+            for row in self.client.query(
                 create_activities_query(
                     env=self.ENV,
                     athlete_id=self.athlete_id,
                     data_source=self.data_source,
                     data_stream=stream,
                 )
-            )
-            .to_dataframe()["activity_id"]
-            .values
-        )
+            ).result()
+        }
         structured_logger.info(
             message="Extracted activity ids for stream",
             activity_id_count=len(activity_ids),
@@ -178,53 +226,76 @@ class BronzeStravaETLInterface(ETLInterface):
             **self._get_common_fields(),
         )
 
-        module_strava_json_list = (
-            list(
-                itertools.islice(
-                    self.partial_strava_storage(strava_model=stream).iterdir(),
-                    int(sample),
-                )
-            )
-            if sample
-            else list(self.partial_strava_storage(strava_model=stream).iterdir())
-        )
+        module_strava_json_list = self._listing.get(stream.value, [])
         if sample:
+            module_strava_json_list = module_strava_json_list[: int(sample)]
             structured_logger.debug(
                 message=f"Sampling has been turned on {sample}",
                 **self._get_common_fields(),
             )
 
+        # Files are named activity_id=<id>.json, so the id is parsed once here.
         filtered_module_strava_json_list = [
-            file
+            (file, activity_id)
             for file in module_strava_json_list
-            if file.stem.split("=")[1] not in activity_ids
+            if (activity_id := file.stem.rpartition("=")[2]) not in activity_ids
         ]
         if not filtered_module_strava_json_list:
             return [], []
         if int(environ.get("WORKER", 1)) > 1 or environ.get("WORKER") is None:
+            with ThreadPoolExecutor(
+                max_workers=int(environ.get("IO_WORKER", GCS_CONCURRENCY))
+            ) as executor:
+                raw_documents = list(
+                    tqdm(
+                        executor.map(
+                            lambda json_file: json_file.read_bytes(),
+                            (
+                                json_file
+                                for json_file, _ in filtered_module_strava_json_list
+                            ),
+                        ),
+                        desc=f"Downloading {stream}",
+                        total=len(filtered_module_strava_json_list),
+                    )
+                )
             with tqdm_joblib(
                 tqdm(
                     desc=f"Processing {stream}",
                     total=len(filtered_module_strava_json_list),
                 )
             ):
+                n_jobs = (
+                    int(environ.get("WORKER", 1))
+                    if environ.get("WORKER")
+                    else mp.cpu_count()
+                )
                 result = Parallel(
-                    n_jobs=(
-                        int(environ.get("WORKER", 1))
-                        if environ.get("WORKER")
-                        else mp.cpu_count()
+                    n_jobs=n_jobs,
+                    backend="loky",
+                    # Roughly four batches per worker keeps dispatch overhead low
+                    # for small files while still balancing the load.
+                    batch_size=max(
+                        1, len(filtered_module_strava_json_list) // (n_jobs * 4)
                     ),
-                    backend="threading",
+                    pre_dispatch="2*n_jobs",
                 )(
-                    delayed(self.load_json_into_dataframe)(
-                        file=json_file, data_stream=stream
+                    delayed(self.parse_and_normalize)(
+                        raw_bytes=raw_bytes,
+                        athlete_id=self.athlete_id,
+                        activity_id=activity_id,
+                        data_stream=stream,
+                    )
+                    for (_, activity_id), raw_bytes in zip(
+                        filtered_module_strava_json_list, raw_documents
                     )
-                    for json_file in filtered_module_strava_json_list
                 )
         else:
             result = [
-                self.load_json_into_dataframe(file=json_file, data_stream=stream)
-                for json_file in filtered_module_strava_json_list
+                self.load_json_into_dataframe(
+                    file=json_file, activity_id=activity_id, data_stream=stream
+                )
+                for json_file, activity_id in filtered_module_strava_json_list
             ]
 
         dataframes = [result["dataframe"] for result in result]
@@ -232,26 +303,24 @@ class BronzeStravaETLInterface(ETLInterface):
         return dataframes, metrics
 
     @staticmethod
-    @beartype
-    def clean_column_names(df: DataFrame) -> DataFrame:
-        """Cleans column names in a DataFrame.
+    def clean_column_names(record: dict) -> dict:
+        """Cleans the column names of a flattened record.
 
-        This method standardizes column names by replacing dots with underscores,
-        removing special characters, and stripping leading/trailing spaces.
+        This method standardizes column names by replacing dots with underscores
+        and removing special characters.
 
         Args:
-            df (DataFrame): The Pandas DataFrame whose column names need to be cleaned.
+            record (dict): The flattened record whose keys need to be cleaned.
 
         Returns:
-            DataFrame: A Pandas DataFrame with cleaned column names.
+            dict: The record keyed by cleaned column names.
         """
-        df.columns = df.columns.str.replace(r"\.", "_", regex=True)
-        df.columns = df.columns.str.replace(r"[^a-zA-Z0-9_]", "", regex=True)
-        df.columns = df.columns.str.strip()
-        return df
+        return {
+            COLUMN_NAME_PATTERN.sub("", column.replace(".", "_")): value
+            for column, value in record.items()
+        }
 
     @staticmethod
-    @beartype
     def process_other_json(data_dict: dict) -> DataFrame:
         """Processes JSON data that is not related to activity or athlete summary.
 
@@ -266,17 +335,25 @@ class BronzeStravaETLInterface(ETLInterface):
         Returns:
             DataFrame: A Pandas DataFrame containing the processed data with added metadata.
         """
-        data = data_dict["data"]
-        data = DataFrame(data={"data": [] if data is None else data})
-        data = data.reset_index(inplace=False, drop=True)
-        data["index"] = np.arange(1, len(data) + 1)
-        data["original_size"] = data_dict["original_size"]
-        data["series_type"] = data_dict["series_type"]
-        return data
+        data = data_dict["data"] or []
+        size = len(data)
+        # LATLNG samples are [lat, lng] pairs, so they stay a list to keep it 1-D.
+        if size and not isinstance(data[0], list):
+            data = np.asarray(data)
+        return DataFrame(
+            {
+                "data": data,
+                "index": np.arange(1, size + 1, dtype=np.int32),
+                "original_size": np.full(
+                    size, data_dict["original_size"], dtype=np.int32
+                ),
+                "series_type": np.full(size, data_dict["series_type"], dtype=object),
+            },
+            copy=False,
+        )
 
-    @beartype
     def load_json_into_dataframe(
-        self, file: GSPath, data_stream: StravaStreams
+        self, file: GSPath, activity_id: str, data_stream: StravaStreams
     ) -> dict[str, DataFrame | Metrics]:
         """Loads a JSON file into a DataFrame and generates associated metrics.
 
@@ -286,6 +363,7 @@ class BronzeStravaETLInterface(ETLInterface):
 
         Args:
             file (GSPath): The path to the JSON file to be loaded.
+            activity_id (str): The ID of the activity the file belongs to.
             data_stream (FitnessLLMDataStream): The type of data stream being processed
                                                 (e.g., activity or athlete summary).
 
@@ -301,33 +379,62 @@ class BronzeStravaETLInterface(ETLInterface):
             message=f"Starting to process {file}",
             **self._get_common_fields(),
         )
-        data_dict = json.loads(file.read_text())
+        return self.parse_and_normalize(
+            raw_bytes=file.read_bytes(),
+            athlete_id=self.athlete_id,
+            activity_id=activity_id,
+            data_stream=data_stream,
+        )
+
+    @staticmethod
+    def parse_and_normalize(
+        raw_bytes: bytes,
+        athlete_id: str,
+        activity_id: str,
+        data_stream: StravaStreams,
+    ) -> dict[str, DataFrame | Metrics]:
+        """Parses raw JSON bytes into a DataFrame and generates associated metrics.
+
+        This is the CPU-bound half of the bronze conversion. It only takes
+        primitives so that it can be dispatched to a process pool.
+
+        Args:
+            raw_bytes (bytes): The raw content of the JSON file.
+            athlete_id (str): The ID of the athlete whose data is being processed.
+            activity_id (str): The ID of the activity the file belongs to.
+            data_stream (StravaStreams): The type of data stream being processed.
+
+        Returns:
+            dict[str, DataFrame | Metrics]: A dictionary containing:
+                - 'dataframe': The processed DataFrame.
+                - 'metrics': Metrics associated with the processed data.
+        """
+        data_dict = json.loads(raw_bytes)
         if isinstance(data_dict, str):
             data_dict = json.loads(data_dict)
 
         partial_metrics = partial(
             Metrics,
-            athlete_id=self.athlete_id,
-            activity_id=file.stem.split("=")[1],
-            data_source=self.data_source,
+            athlete_id=athlete_id,
+            activity_id=activity_id,
+            data_source=FitnessLLMDataSource.STRAVA,
             data_stream=data_stream,
         )
         # TODO: Turn this into a dictionary with functions
         if data_stream in [StravaStreams.ATHLETE_SUMMARY, StravaStreams.ACTIVITY]:
-            df = pd.json_normalize(data_dict)
+            record = BronzeStravaETLInterface.clean_column_names(
+                flatten_json(data_dict)
+            )
+            # The Strava id is replaced by the ids the file was stored under.
+            record.pop("id", None)
+            record["athlete_id"] = athlete_id
             if data_stream == StravaStreams.ACTIVITY:
-                df = self.clean_column_names(df)
-                df.rename(columns={"id": "activity_id"}, inplace=True)
-                df["athlete_id"] = df["athlete_id"].astype(str)
-                df["activity_id"] = df["activity_id"].astype(str)
-            if data_stream == StravaStreams.ATHLETE_SUMMARY:
-                df = self.clean_column_names(df)
-                df.rename(columns={"id": "athlete_id"}, inplace=True)
-                df["athlete_id"] = df["athlete_id"].astype(str)
+                record["activity_id"] = activity_id
+            df = DataFrame([record])
         else:
-            df = self.process_other_json(data_dict)
-            df["athlete_id"] = self.athlete_id
-            df["activity_id"] = file.stem.split("=")[1]
+            df = BronzeStravaETLInterface.process_other_json(data_dict)
+            df["athlete_id"] = athlete_id
+            df["activity_id"] = activity_id
 
         df = execute_etl_func(stream=data_stream, df=df)
 
@@ -336,6 +443,51 @@ class BronzeStravaETLInterface(ETLInterface):
             "metrics": partial_metrics(record_count=df.shape[0]),
         }
 
+    def _append_rows(
+        self,
+        destination: str,
+        schema: list[bigquery.SchemaField],
+        rows: Iterable[dict],
+    ) -> int:
+        """Appends rows to a BigQuery table through the Storage Write API.
+
+        Args:
+            destination (str): The destination table in BigQuery.
+            schema (list[bigquery.SchemaField]): The schema of the destination table.
+            rows (Iterable[dict]): Rows to write, keyed by column name.
+
+        Returns:
+            int: Number of rows written.
+        """
+        return append_rows(
+            write_client=self.write_client,
+            table=bigquery.TableReference.from_string(
+                destination, default_project=self.client.project
+            ),
+            schema=schema,
+            rows=rows,
+        )
+
+    @staticmethod
+    def iterate_rows(dataframes: list[DataFrame], timestamp: int) -> Iterator[dict]:
+        """Yields the rows of each DataFrame with the insert timestamp attached.
+
+        Rows are produced one DataFrame at a time, so the stream is never
+        concatenated into a single DataFrame in memory.
+
+        Args:
+            dataframes (list[DataFrame]): List of DataFrames to iterate over.
+            timestamp (int): The insert timestamp for every row, in microseconds
+                since epoch.
+
+        Yields:
+            dict: A row keyed by column name.
+        """
+        for df in dataframes:
+            for row in df.to_dict(orient="records"):
+                row["metadata_insert_timestamp"] = timestamp
+                yield row
+
     @beartype
     def upsert_to_bigquery(
         self,
@@ -354,9 +506,7 @@ class BronzeStravaETLInterface(ETLInterface):
             None
         """
         timestamp = datetime.now()
-        df = pd.concat(dataframes, ignore_index=True)
-        df["metadata_insert_timestamp"] = pd.to_datetime(timestamp)
-        if df.empty:
+        if all(df.empty for df in dataframes):
             structured_logger.info(
                 message=f"No data to upsert for {stream.value}",
                 **self._get_common_fields(),
@@ -364,30 +514,21 @@ class BronzeStravaETLInterface(ETLInterface):
             return
 
         try:
-            temp_dir = tempfile.TemporaryDirectory()
-            try:
-                job = self.client.load_table_from_dataframe(
-                    dataframe=df,
-                    destination=f"{self.client.project}.{self.ENV}_bronze_{self.data_source.value.lower()}.{stream.value}",
-                    job_config=bigquery.LoadJobConfig(
-                        write_disposition=bigquery.WriteDisposition.WRITE_APPEND,
-                        schema=load_schema_from_json(
-                            data_source=self.data_source, data_stream=stream
-                        ),
-                    ),
-                )
-                result = job.result()
-                if result.state == "DONE":
-                    self.insert_metrics(
-                        metrics_list=metrics,
-                        destination=f"{self.client.project}.{self.ENV}_metrics.metrics",
-                        timestamp=timestamp,
-                        status=Status.SUCCESS,
-                    )
-                    return
-                raise Exception("Job did not complete successfully")
-            finally:
-                temp_dir.cleanup()
+            self._append_rows(
+                destination=f"{self.client.project}.{self.ENV}_bronze_{self.data_source.value.lower()}.{stream.value}",
+                schema=load_schema_from_json(
+                    data_source=self.data_source, data_stream=stream
+                ),
+                rows=self.iterate_rows(
+                    dataframes=dataframes, timestamp=to_epoch_micros(timestamp)
+                ),
+            )
+            self.insert_metrics(
+                metrics_list=metrics,
+                destination=f"{self.client.project}.{self.ENV}_metrics.metrics",
+                timestamp=timestamp,
+                status=Status.SUCCESS,
+            )
         except Exception as e:
             structured_logger.error(
                 message=f"Error while inserting {stream.value} into BigQuery for {self.athlete_id}",
@@ -409,7 +550,7 @@ class BronzeStravaETLInterface(ETLInterface):
         timestamp: datetime,
         status: Status,
     ):
-        """Inserts metrics into BigQuery.
+        """Queues metrics to be inserted into BigQuery by flush_metrics.
 
         Args:
             metrics_list (list[Metrics]): List of metrics to insert.
@@ -417,40 +558,32 @@ class BronzeStravaETLInterface(ETLInterface):
             timestamp (datetime): The timestamp for the metrics.
             status (Status): The status of the metrics.
 
+        Returns:
+            None
+        """
+        shared_fields = {
+            "status": status.value,
+            "bq_insert_timestamp": to_epoch_micros(timestamp),
+        }
+        self._pending_metrics[destination].extend(
+            metrics.as_dict() | shared_fields for metrics in metrics_list
+        )
+
+    @beartype
+    def flush_metrics(self) -> None:
+        """Inserts all queued metrics into BigQuery, one write per destination.
+
         Returns:
             None
         """
         try:
-            metrics_list_converted = [
-                metrics.update(
-                    bq_insert_timestamp=timestamp, status=status.value
-                ).as_dict()
-                for metrics in metrics_list
-            ]
-            dataframe = DataFrame(metrics_list_converted)
-            dataframe["bq_insert_timestamp"] = pd.to_datetime(
-                dataframe["bq_insert_timestamp"]
-            )
-            temp_dir = tempfile.TemporaryDirectory()
-            try:
-                job = self.client.load_table_from_dataframe(
-                    dataframe=dataframe,
+            while self._pending_metrics:
+                destination, metrics_list = self._pending_metrics.popitem()
+                self._append_rows(
                     destination=destination,
-                    job_config=bigquery.LoadJobConfig(
-                        write_disposition=bigquery.WriteDisposition.WRITE_APPEND
-                    ),
+                    schema=load_schema_from_json(data_source=None, data_stream=None),
+                    rows=metrics_list,
                 )
-                result = job.result()
-                if result.state != "DONE":
-                    structured_logger.error(
-                        message="Unable to insert metrics into BigQuery.",
-                        **self._get_common_fields(),
-                    )
-                    raise Exception(
-                        "Metrics insertion job did not complete successfully"
-                    )
-            finally:
-                temp_dir.cleanup()
         except Exception as e:
             structured_logger.error(
                 message="Unable to write metrics to BigQuery",
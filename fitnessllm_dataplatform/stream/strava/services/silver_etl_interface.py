@@ -2,14 +2,28 @@
 
 import os
 import pathlib
+from functools import lru_cache
+from itertools import batched
 
 from beartype import beartype
 from fitnessllm_shared.logger_utils import structured_logger
-from tqdm import tqdm
+from google.cloud import bigquery
 
 from fitnessllm_dataplatform.entities.enums import FitnessLLMDataSource
 from fitnessllm_dataplatform.services.etl_interface import ETLInterface
-from fitnessllm_dataplatform.utils.query_utils import get_delete_query, get_insert_query
+from fitnessllm_dataplatform.utils.query_utils import get_merge_query
+
+# Stays well below BigQuery's interactive query concurrency quota.
+MAX_CONCURRENT_JOBS = 20
+SILVER_SQL_PATH = "fitnessllm_dataplatform/stream/strava/schemas/silver/sql"
+
+
+@lru_cache(maxsize=1)
+def discover_silver_queries() -> tuple[str, ...]:
+    """Returns the silver SQL files, listed once per process."""
+    return tuple(
+        sorted(query for query in os.listdir(SILVER_SQL_PATH) if query.endswith(".sql"))
+    )
 
 
 class SilverStravaETLInterface(ETLInterface):
@@ -19,98 +33,125 @@ class SilverStravaETLInterface(ETLInterface):
     and loading (ETL) of Strava data into the Silver layer of the data platform.
 
     Attributes:
-        SERVICE_NAME (str): The name of the service, used for logging and identification.
+        service_name (str): The name of the service, used for logging and identification.
     """
 
-    SERVICE_NAME = "silver_etl"
+    service_name = "silver_etl"
 
-    def __init__(self, uid: str, athlete_id: str):
+    def __init__(self, uid: str, athlete_ids: list[str]):
         """Initializes the Silver Strava ETL Interface.
 
         This constructor sets up the necessary attributes for the ETL process,
-        including a unique identifier and the athlete ID.
+        including a unique identifier and the athlete IDs. Every silver table is
+        rebuilt for all athletes in one job, so batching athletes cuts job count.
 
         Args:
             uid (str): A unique identifier for the ETL process.
-            athlete_id (str): The ID of the athlete whose data is being processed.
+            athlete_ids (list[str]): The IDs of the athletes whose data is being processed.
         """
         super().__init__()
         self.uid = uid
         self.data_source = FitnessLLMDataSource.STRAVA
-        self.athlete_id = athlete_id
+        self.athlete_ids = athlete_ids
+        source = self.data_source.value.lower()
+        self.bronze_dataset = f"{self.ENV}_bronze_{source}"
+        self.silver_dataset = f"{self.ENV}_silver_{source}"
 
     @beartype
-    def _get_common_fields(self) -> dict[str, str]:
+    def _get_common_fields(self) -> dict:
         fields = super()._get_common_fields()
-        fields.update({"athlete_id": self.athlete_id})
+        fields.update({"athlete_count": len(self.athlete_ids)})
         return fields
 
     def task_handler(self):
         """Handles the execution of ETL tasks for Strava data.
 
-        This method processes SQL queries located in the specified directory,
-        executes delete and insert operations on the target tables in the Silver
-        layer, and logs the results of each operation. It ensures that data is
-        properly transformed and loaded into the Silver layer.
+        This method processes SQL queries located in the specified directory and
+        replaces the athlete's rows in the matching Silver tables, one MERGE per
+        table. Each silver table is independent, so the jobs of a batch are
+        submitted together and only then awaited.
 
         Raises:
-            Exception: If any query execution fails or encounters an error.
+            Exception: If any query fails to submit or execute, once every
+                submitted job has finished.
         """
-        path = "fitnessllm_dataplatform/stream/strava/schemas/silver/sql"
-        list_of_queries = os.listdir(path)
+        path = SILVER_SQL_PATH
+        list_of_queries = discover_silver_queries()
 
         parameters = {
-            "schema": f"{self.ENV}_bronze_{self.data_source.value.lower()}",
-            "athlete_id": self.athlete_id,
+            "schema": self.bronze_dataset,
         }
 
-        for query in tqdm(list_of_queries):
-            self.silver_etl(path=path, parameters=parameters, query=query)
+        errors = []
+        summary = []
+        for batch in batched(list_of_queries, MAX_CONCURRENT_JOBS):
+            # A failed submission is recorded like a failed job, so the jobs
+            # already submitted are still awaited.
+            jobs = []
+            for query in batch:
+                try:
+                    job = self.silver_etl(path=path, parameters=parameters, query=query)
+                except Exception as e:
+                    structured_logger.error(
+                        message="Failed to submit query",
+                        query=query,
+                        **self._get_common_fields(),
+                        **self._get_exception_fields(e),
+                    )
+                    errors.append(e)
+                    summary.append({"table": query.split(".")[0], "failed": True})
+                    continue
+                jobs.append((query, job))
+            for query, job in jobs:
+                try:
+                    job.result()
+                except Exception as e:
+                    structured_logger.error(
+                        message="Query failed with error",
+                        query=job.query,
+                        **self._get_common_fields(),
+                        **self._get_exception_fields(e),
+                    )
+                    errors.append(e)
+                    summary.append({"table": query.split(".")[0], "failed": True})
+                    continue
+                summary.append(
+                    {
+                        "table": query.split(".")[0],
+                        "affected_rows": job.num_dml_affected_rows,
+                        "duration_s": (job.ended - job.started).total_seconds(),
+                    }
+                )
+        structured_logger.info(
+            message="Silver ETL completed",
+            summary=summary,
+            failed_count=len(errors),
+            **self._get_common_fields(),
+        )
+        if errors:
+            raise errors[0]
 
     @beartype
-    def silver_etl(self, path: str, parameters: dict, query: str) -> None:
-        """Executes the Silver ETL process for Strava data."""
-        target_destination = (
-            f"{self.ENV}_silver_{self.data_source.value.lower()}.{query.split('.')[0]}"
-        )
+    def silver_etl(self, path: str, parameters: dict, query: str) -> bigquery.QueryJob:
+        """Submits the Silver ETL job for one Strava silver table.
+
+        Returns:
+            The submitted query job, which is not awaited.
+        """
+        target_destination = f"{self.silver_dataset}.{query.split('.')[0]}"
         query_path = pathlib.Path(path, query)
 
-        delete_query = get_delete_query(
-            target_table=target_destination, parameters=parameters
-        )
-        delete_job = self.client.query(delete_query)
-        delete_job.result()
-        if delete_job.state != "DONE" and delete_job.error is not None:
-            structured_logger.error(
-                message="Query failed with error",
-                query=delete_query,
-                error=delete_job.error,
-                **self._get_common_fields(),
-            )
-            return
-        structured_logger.debug(
-            message="Query successfully deleted rows",
-            query=delete_query,
-            num_deleted=delete_job.num_dml_affected_rows,
-            **self._get_common_fields(),
-        )
-        insert_query = get_insert_query(
+        merge_query = get_merge_query(
             target_table=target_destination,
             query_path=query_path,
             parameters=parameters,
         )
-        insert_job = self.client.query(insert_query)
-        insert_job.result()
-        if insert_job.state != "DONE" and insert_job.error is not None:
-            structured_logger.error(
-                message="Query failed with error",
-                query=insert_query,
-                **self._get_common_fields(),
-            )
-            return
-        structured_logger.debug(
-            message="Query successfully inserted rows",
-            num_inserted=insert_job.num_dml_affected_rows,
-            query=insert_query,
-            **self._get_common_fields(),
+        # Ids are bound as query parameters, so the SQL text is the same for
+        # every batch of athletes.
+        query_parameters = [
+            bigquery.ArrayQueryParameter("athlete_ids", "STRING", self.athlete_ids)
+        ]
+        return self.client.query(
+            merge_query,
+            job_config=bigquery.QueryJobConfig(query_parameters=query_parameters),
         )
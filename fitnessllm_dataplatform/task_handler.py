@@ -1,34 +1,69 @@
 """Main entry point for the data platform."""
 
 import traceback
-from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+from enum import EnumType
+from functools import lru_cache, partial
 from os import environ
-from typing import Optional
+from types import MappingProxyType
+from typing import Callable, Mapping, Optional
 
 import fire
 from beartype import beartype
-from cloudpathlib import GSClient
 from fitnessllm_shared.logger_utils import structured_logger
 from fitnessllm_shared.task_utils import decrypt_token
 
 from fitnessllm_dataplatform.entities.enums import DynamicEnum, FitnessLLMDataSource
 from fitnessllm_dataplatform.infrastructure.FirebaseConnect import FirebaseConnect
 from fitnessllm_dataplatform.stream.strava.qc_utils import check_firebase_strava_data
-from fitnessllm_dataplatform.stream.strava.services.api_interface import (
-    StravaAPIInterface,
-)
-from fitnessllm_dataplatform.stream.strava.services.bronze_etl_interface import (
-    BronzeStravaETLInterface,
-)
-from fitnessllm_dataplatform.stream.strava.services.silver_etl_interface import (
-    SilverStravaETLInterface,
-)
-from fitnessllm_dataplatform.utils.cloud_utils import get_secret
+from fitnessllm_dataplatform.utils.cloud_utils import create_gs_client, get_secret
+
+# Entry points are only type checked at runtime when BEARTYPE_ENABLE=1, so
+# production batch runs skip the per-call checks.
+typecheck = beartype if environ.get("BEARTYPE_ENABLE") == "1" else lambda func: func
+
+# Number of users ingested at the same time by ProcessUser.batch.
+BATCH_WORKERS = 4
+# ETL steps run by each ProcessUser.batch phase, in order.
+BATCH_PHASES = {
+    "ingest": ("ingest",),
+    "bronze_etl": ("bronze_etl",),
+    "silver_etl": ("silver_etl",),
+    "full_etl": ("ingest", "bronze_etl", "silver_etl"),
+}
+
+
+@lru_cache(maxsize=8)
+def get_infrastructure_names(secret_name: str, stage: str) -> EnumType:
+    """Builds the infrastructure names Enum of a stage, once per process.
+
+    Args:
+        secret_name: Name of the secret holding infrastructure names per stage.
+        stage: Stage to build the Enum for.
+
+    Returns:
+        Enum of infrastructure names
+    """
+    return DynamicEnum.from_dict(get_secret(secret_name)[stage])
 
 
 class ProcessUser:
     """Main entry point for the data platform."""
 
+    __slots__ = (
+        "uid",
+        "data_source",
+        "_common_fields",
+        "firebase",
+        "InfrastructureNames",
+        "decryptor",
+        "_data_source_documents",
+        "_strava_athlete_id",
+        "_ingest_dispatch",
+        "_bronze_dispatch",
+        "_silver_dispatch",
+    )
+
     def __init__(self, uid: str, data_source: str) -> None:
         """Initializes the data platform.
 
@@ -38,6 +73,13 @@ class ProcessUser:
         """
         self.uid = uid
         self.data_source = data_source
+        self._common_fields = MappingProxyType(
+            {
+                "uid": self.uid,
+                "data_source": self.data_source,
+                "service_name": "task_handler",
+            }
+        )
 
         if self.uid is None:
             structured_logger.error("UID is not provided", **self._get_common_fields())
@@ -46,28 +88,156 @@ class ProcessUser:
         structured_logger.info(
             message="Starting up data platform", **self._get_common_fields()
         )
-        GSClient().set_as_default_client()
-        self.InfrastructureNames = DynamicEnum.from_dict(
-            get_secret(environ["INFRASTRUCTURE_SECRET"])[environ["STAGE"]],
-        )
-        self.firebase = FirebaseConnect(uid=self.uid)
-        self.decryptor = partial(
-            decrypt_token,
-            key=get_secret(environ["ENCRYPTION_SECRET"])["token"],
+        # The secrets are independent RPCs, so they are fetched while the
+        # Firebase client is set up.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            infrastructure_names = executor.submit(
+                get_infrastructure_names,
+                environ["INFRASTRUCTURE_SECRET"],
+                environ["STAGE"],
+            )
+            encryption_secret = executor.submit(
+                get_secret, environ["ENCRYPTION_SECRET"]
+            )
+            self.firebase = FirebaseConnect(uid=self.uid)
+            self.InfrastructureNames = infrastructure_names.result()
+            self.decryptor = partial(
+                decrypt_token,
+                key=encryption_secret.result()["token"],
+            )
+        self._data_source_documents: dict[FitnessLLMDataSource, dict] = {}
+        self._strava_athlete_id: Optional[str] = None
+        self._ingest_dispatch = {
+            FitnessLLMDataSource.STRAVA.value: self._strava_ingest_etl,
+        }
+        self._bronze_dispatch = {
+            FitnessLLMDataSource.STRAVA.value: self._strava_bronze_etl,
+        }
+        self._silver_dispatch = {
+            FitnessLLMDataSource.STRAVA.value: self._strava_silver_etl,
+        }
+
+    @classmethod
+    def batch(
+        cls,
+        uids: list[str],
+        data_source: str,
+        phase: str = "full_etl",
+        max_workers: int = BATCH_WORKERS,
+    ) -> None:
+        """Runs one ETL phase for many users in a single process.
+
+        Secrets, the infrastructure names and the storage client are cached per
+        process, so they are loaded once up front and shared by every user.
+        Ingest mostly waits on Firestore and the Strava API, so users are
+        ingested concurrently. Converting a user's streams already fills the
+        download pool and the process pool, so bronze runs one user at a time.
+        Silver is rebuilt once for every athlete of the batch, so no two silver
+        jobs write to the same table at the same time.
+
+        A user whose step fails is skipped by the following steps.
+
+        Args:
+            uids: User IDs to process
+            data_source: Data source to process
+            phase: ETL phase to run, one of ingest, bronze_etl, silver_etl or
+                full_etl
+            max_workers: Number of users ingested at the same time
+
+        Raises:
+            ValueError: If phase or data source is not supported.
+            Exception: The first error raised while processing the batch, once
+                every user has been processed.
+        """
+        if phase not in BATCH_PHASES:
+            raise ValueError(f"Unsupported phase: {phase}")
+        if data_source != FitnessLLMDataSource.STRAVA.value:
+            raise ValueError(f"Unsupported data source: {data_source}")
+        steps = BATCH_PHASES[phase]
+        get_infrastructure_names(environ["INFRASTRUCTURE_SECRET"], environ["STAGE"])
+        get_secret(environ["ENCRYPTION_SECRET"])
+        create_gs_client()
+
+        errors: dict[str, Exception] = {}
+
+        def record_error(uid: str, step: str, e: Exception) -> None:
+            structured_logger.error(
+                message="Failed to process user in batch",
+                uid=uid,
+                data_source=data_source,
+                phase=step,
+                service_name="task_handler",
+                **cls._get_exception_fields(e),
+            )
+            errors.setdefault(uid, e)
+
+        users = {}
+        for uid in uids:
+            try:
+                users[uid] = cls(uid=uid, data_source=data_source)
+            except Exception as e:
+                record_error(uid, "init", e)
+
+        if "ingest" in steps:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    uid: executor.submit(user.ingest) for uid, user in users.items()
+                }
+                for uid, future in futures.items():
+                    try:
+                        future.result()
+                    except Exception as e:
+                        record_error(uid, "ingest", e)
+                        del users[uid]
+
+        if "bronze_etl" in steps:
+            for uid, user in list(users.items()):
+                try:
+                    user.bronze_etl()
+                except Exception as e:
+                    record_error(uid, "bronze_etl", e)
+                    del users[uid]
+
+        if "silver_etl" in steps:
+            from fitnessllm_dataplatform.stream.strava.services.silver_etl_interface import (
+                SilverStravaETLInterface,
+            )
+
+            athlete_ids = []
+            for uid, user in users.items():
+                try:
+                    athlete_ids.append(user.get_strava_athlete_id())
+                except Exception as e:
+                    record_error(uid, "silver_etl", e)
+            if athlete_ids:
+                try:
+                    SilverStravaETLInterface(
+                        uid="all", athlete_ids=athlete_ids
+                    ).task_handler()
+                except Exception as e:
+                    record_error("all", "silver_etl", e)
+
+        structured_logger.info(
+            message="Batch completed",
+            user_count=len(uids),
+            failed_count=len(errors),
+            data_source=data_source,
+            phase=phase,
+            service_name="task_handler",
         )
+        if errors:
+            raise next(iter(errors.values()))
 
-    def _get_common_fields(self) -> dict:
+    def _get_common_fields(self) -> Mapping:
         """Get a logger with common fields.
 
+        The fields never change for an instance, so they are built once in
+        __init__ and shared read-only.
+
         Returns:
-            Dict of common logging fields
+            Mapping of common logging fields
         """
-        fields = {
-            "uid": self.uid,
-            "data_source": self.data_source,
-            "service_name": "task_handler",
-        }
-        return fields
+        return self._common_fields
 
     @staticmethod
     def _get_exception_fields(e: Exception) -> dict:
@@ -79,7 +249,7 @@ class ProcessUser:
         fields = {
             "exception": str(e),
             "exception_type": type(e).__name__,
-            "traceback": traceback.format_exc(),
+            "traceback": "".join(traceback.format_exception(e)),
         }
         return fields
 
@@ -88,12 +258,16 @@ class ProcessUser:
     ) -> dict:
         """Get the firebase document for a given data source.
 
+        The document is read once and reused by every ETL step of this run.
+
         Args:
             data_source: Data source to get document for.
 
         Returns:
             Dict of firebase document
         """
+        if data_source in self._data_source_documents:
+            return self._data_source_documents[data_source]
         document = (
             self.firebase.read_user()
             .collection("stream")
@@ -106,61 +280,93 @@ class ProcessUser:
                 message="User has no data", **self._get_common_fields()
             )
             raise ValueError(f"User {self.uid} has no {data_source.value} data")
+        self._data_source_documents[data_source] = document
         return document
 
-    @beartype
-    def ingest(self) -> None:
-        """Entry point for downloading JSONs from API.
+    def get_strava_athlete_id(self) -> str:
+        """Get the Strava athlete ID of the user.
+
+        The Strava document is checked and the ID parsed once, then shared by
+        the bronze and silver steps of this run.
+
+        Returns:
+            Strava athlete ID
+        """
+        if self._strava_athlete_id is None:
+            strava_user_data = self._get_firebase_data_source_document(
+                data_source=FitnessLLMDataSource.STRAVA
+            )
+            check_firebase_strava_data(strava_user_data, **self._get_common_fields())
+            self._strava_athlete_id = str(strava_user_data["athlete"]["id"])
+        return self._strava_athlete_id
+
+    @staticmethod
+    def _use_gs_client() -> None:
+        """Set the shared storage client as the default cloudpathlib client.
+
+        Only the steps reading or writing bucket paths call this, so silver
+        runs skip the storage client setup.
+        """
+        create_gs_client().set_as_default_client()
+
+    def _get_etl_step(self, dispatch: dict[str, Callable]) -> Callable:
+        """Get the ETL step of the current data source from a dispatch table.
+
+        Args:
+            dispatch: Mapping of data source to the ETL step handling it.
+
+        Returns:
+            The ETL step for the current data source.
 
         Raises:
-            KeyError: If required options or environment variables are missing.
             ValueError: If data source is not supported.
         """
-        if self.data_source not in [member.value for member in FitnessLLMDataSource]:
+        etl_step = dispatch.get(self.data_source)
+        if etl_step is None:
             structured_logger.error(
                 message="Unsupported data source", **self._get_common_fields()
             )
             raise ValueError(f"Unsupported data source: {self.data_source}")
+        return etl_step
+
+    @typecheck
+    def ingest(self) -> None:
+        """Entry point for downloading JSONs from API.
 
-        if self.data_source == FitnessLLMDataSource.STRAVA.value:
-            self._strava_ingest_etl()
+        Raises:
+            KeyError: If required options or environment variables are missing.
+            ValueError: If data source is not supported.
+        """
+        self._get_etl_step(self._ingest_dispatch)()
 
-    @beartype
+    @typecheck
     def bronze_etl(self, data_streams: Optional[list[str]] = None) -> None:
         """Entry point for loading JSONs into bronze layer.
 
         Raises:
-            KeyError: If required data_source is not supported.
+            ValueError: If data source is not supported.
         """
-        if self.data_source == FitnessLLMDataSource.STRAVA.value:
-            self._strava_bronze_etl(data_streams=data_streams)
-        else:
-            structured_logger.error(
-                "Unsupported data source", **self._get_common_fields()
-            )
-            raise ValueError(f"Unsupported data source: {self.data_source}")
+        self._get_etl_step(self._bronze_dispatch)(data_streams=data_streams)
 
-    @beartype
+    @typecheck
     def silver_etl(self) -> None:
         """Entry point for loading data from bronze to silver.
 
         Raises:
-            KeyError: If required data_source is not supported.
+            ValueError: If data source is not supported.
         """
-        if self.data_source == FitnessLLMDataSource.STRAVA.value:
-            self._strava_silver_etl()
-        else:
-            structured_logger.error(
-                "Unsupported data source", **self._get_common_fields()
-            )
-            raise ValueError(f"Unsupported data source: {self.data_source}")
+        self._get_etl_step(self._silver_dispatch)()
 
-    @beartype
-    def full_etl(self, data_streams: Optional[list[str]] = None) -> None:
+    @typecheck
+    def full_etl(
+        self, data_streams: Optional[list[str]] = None, run_silver: bool = True
+    ) -> None:
         """Entry point for full ETL process.
 
         Args:
             data_streams: List of data streams to load for bronze ETL. If None, all streams will be loaded.
+            run_silver: Whether to run the silver ETL. Batch runs skip it and rebuild
+                silver once for all users.
 
         Raises:
             KeyError: If required data_source is not supported.
@@ -172,15 +378,22 @@ class ProcessUser:
         self.bronze_etl(data_streams=data_streams)
 
         # Silver ETL
-        self.silver_etl()
+        if run_silver:
+            self.silver_etl()
 
         structured_logger.info(
             "Full ETL process completed successfully", **self._get_common_fields()
         )
 
-    @beartype
+    @typecheck
     def _strava_ingest_etl(self) -> None:
         """Ingest ETL for Strava."""
+        # ETL interfaces are imported per phase, so a CLI run only loads the
+        # SDKs of the phase it runs.
+        from fitnessllm_dataplatform.stream.strava.services.api_interface import (
+            StravaAPIInterface,
+        )
+
         strava_user_data = self._get_firebase_data_source_document(
             data_source=FitnessLLMDataSource.STRAVA
         )
@@ -190,6 +403,7 @@ class ProcessUser:
             )
             raise ValueError(f"User {self.uid} has no {self.data_source} data")
 
+        self._use_gs_client()
         strava_api_interface = StravaAPIInterface(
             uid=self.uid,
             infrastructure_names=self.InfrastructureNames,
@@ -208,35 +422,32 @@ class ProcessUser:
             )
             raise RuntimeError(f"Failed to get data from Strava API: {e}") from e
 
-    @beartype
+    @typecheck
     def _strava_bronze_etl(self, data_streams: Optional[list[str]] = None) -> None:
         """Bronze ETL for Strava."""
-        strava_user_data = self._get_firebase_data_source_document(
-            data_source=FitnessLLMDataSource.STRAVA
+        from fitnessllm_dataplatform.stream.strava.services.bronze_etl_interface import (
+            BronzeStravaETLInterface,
         )
 
-        check_firebase_strava_data(strava_user_data, **self._get_common_fields())
-
+        self._use_gs_client()
         strava_etl_interface = BronzeStravaETLInterface(
             uid=self.uid,
             infrastructure_names=self.InfrastructureNames,
-            athlete_id=str(strava_user_data["athlete"]["id"]),
+            athlete_id=self.get_strava_athlete_id(),
             data_streams=data_streams,
         )
         strava_etl_interface.load_json_into_bq()
 
-    @beartype
+    @typecheck
     def _strava_silver_etl(self) -> None:
         """Silver ETL for Strava."""
-        strava_user_data = self._get_firebase_data_source_document(
-            data_source=FitnessLLMDataSource.STRAVA
+        from fitnessllm_dataplatform.stream.strava.services.silver_etl_interface import (
+            SilverStravaETLInterface,
         )
 
-        check_firebase_strava_data(strava_user_data, **self._get_common_fields())
-
         strava_etl_interface = SilverStravaETLInterface(
             uid=self.uid,
-            athlete_id=str(strava_user_data["athlete"]["id"]),
+            athlete_ids=[self.get_strava_athlete_id()],
         )
         strava_etl_interface.task_handler()
 
@@ -247,4 +458,5 @@ if __name__ == "__main__":
     # python task_handler.py --uid=user123 --data_source=strava bronze_etl
     # python task_handler.py --uid=user123 --data_source=strava silver_etl
     # python task_handler.py --uid=user123 --data_source=strava full_etl
+    # python task_handler.py batch --uids=[user123,user456] --data_source=strava
     fire.Fire(ProcessUser)
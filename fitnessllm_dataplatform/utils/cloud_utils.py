@@ -2,11 +2,17 @@
 
 import json
 import traceback
+from functools import lru_cache
 from os import environ
 
-from cloudpathlib import CloudPath
+import google.auth
+from cloudpathlib import CloudPath, GSClient
 from fitnessllm_shared.logger_utils import structured_logger
-from google.cloud import secretmanager
+from google.auth.transport.requests import AuthorizedSession
+from google.cloud import secretmanager, storage
+from requests.adapters import HTTPAdapter
+
+GCS_CONCURRENCY = 64
 
 
 def create_resource_path(project_id: str, service: str, name: str) -> str:
@@ -14,20 +20,50 @@ def create_resource_path(project_id: str, service: str, name: str) -> str:
     return f"projects/{project_id}/{service}/{name}/versions/latest"
 
 
+@lru_cache(maxsize=1)
+def create_gs_client(pool_size: int = GCS_CONCURRENCY) -> GSClient:
+    """Creates a GSClient whose HTTP connection pool fits pool_size threads.
+
+    The default pool keeps 10 connections, so parallel downloads beyond that
+    keep opening and discarding connections. The client is created once per
+    process and shared by every user processed in it.
+
+    The authorized session is built here and passed to the storage client, so
+    no adapter of a session owned by google-auth is replaced. If mutual TLS is
+    configured, its adapter is kept instead of the sized one.
+    """
+    credentials, _ = google.auth.default(scopes=storage.Client.SCOPE)
+    session = AuthorizedSession(credentials)
+    session.configure_mtls_channel()
+    if not session.is_mtls:
+        session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size),
+        )
+    storage_client = storage.Client(credentials=credentials, _http=session)
+    return GSClient(storage_client=storage_client)
+
+
+@lru_cache(maxsize=1)
+def create_secret_manager_client() -> secretmanager.SecretManagerServiceClient:
+    """Creates the Secret Manager client once per process."""
+    structured_logger.debug("Initializing secret manager")
+    return secretmanager.SecretManagerServiceClient()
+
+
+@lru_cache(maxsize=32)
 def get_secret(name: str) -> dict:
-    """Retrieve secret from secret manager."""
+    """Retrieve secret from secret manager, once per process and secret."""
     if "PROJECT_ID" not in environ:
         raise KeyError("PROJECT_ID environment variable is not set")
-    structured_logger.debug("Initializing secret manager")
-    client = secretmanager.SecretManagerServiceClient()
-    structured_logger.debug(f"Getting secret for {name}")
+    client = create_secret_manager_client()
+    structured_logger.debug("Getting secret", secret_name=name)
     try:
         response = client.access_secret_version(
             request={
                 "name": create_resource_path(environ["PROJECT_ID"], "secrets", name)
             }
         )
-        structured_logger.debug(f"Secret manager response: {response}")
         secret_payload = response.payload.data.decode("UTF-8")
         return json.loads(secret_payload)
     except Exception as e:
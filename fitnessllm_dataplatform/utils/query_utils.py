@@ -1,5 +1,6 @@
 """Common query utilities."""
 
+from functools import lru_cache
 from pathlib import Path
 
 from beartype import beartype
@@ -7,27 +8,18 @@ from jinja2 import Template
 from sqlglot import exp, parse_one
 
 
-# TODO: These delete functions can be refactored to be just one function; this is too noisy.
 @beartype
-def get_delete_user_data_query(target_table: str, athlete_id: str) -> str:
-    """Returns a query to delete data for a specific user."""
-    return f"DELETE FROM {target_table} WHERE athlete_id = '{athlete_id}'"
-
-
-@beartype
-def get_delete_query(target_table: str, parameters: dict[str, str]) -> str:
-    """Returns a query to delete data for a specific user."""
-    return f"{get_delete_user_data_query(target_table=target_table, athlete_id=parameters['athlete_id'])};"
-
-
-@beartype
-def get_insert_query(
+def get_merge_query(
     target_table: str, query_path: Path, parameters: dict[str, str]
 ) -> str:
-    """Returns a partitioned insert query with the given parameters.
+    """Returns a MERGE that replaces a batch of users' rows in a single statement.
+
+    Nothing is matched, so every source row is inserted, and the users'
+    existing rows are deleted as unmatched by source. The delete is bound to
+    the @athlete_ids array query parameter, so the query must be run with it set.
 
     Args:
-        target_table: The target table to insert data into.
+        target_table: The target table to replace data in.
         query_path: Query to be parameterized
         parameters: A dictionary of parameters to be replaced in the query.
 
@@ -35,12 +27,28 @@ def get_insert_query(
         Atomic query string
     """
     return f"""
-        INSERT INTO {target_table}
-        {get_parameterized_query(query_path=query_path,
-                                 parameters=parameters)};
+        MERGE {target_table} T
+        USING ({get_parameterized_query(query_path=query_path,
+                                        parameters=parameters)}) S
+        ON FALSE
+        WHEN NOT MATCHED THEN INSERT ROW
+        WHEN NOT MATCHED BY SOURCE AND T.athlete_id IN UNNEST(@athlete_ids) THEN DELETE;
     """
 
 
+@lru_cache(maxsize=32)
+def load_query_template(query_path: Path) -> Template:
+    """Returns the compiled Jinja template of a query file, cached per path."""
+    with open(query_path) as f:
+        return Template(f.read())
+
+
+@lru_cache(maxsize=128)
+def is_select_query(raw_sql: str) -> bool:
+    """Returns whether a query is a SELECT, parsing each distinct query once."""
+    return parse_one(raw_sql).find(exp.Select) is not None
+
+
 def get_parameterized_query(
     query_path: Path,
     parameters: dict[str, str],
@@ -54,12 +62,7 @@ def get_parameterized_query(
     Returns:
         The parameterized query string.
     """
-    with open(query_path) as f:
-        query = f.read()
-
-    template = Template(query)
-    raw_sql = template.render(parameters)
-    parsed = parse_one(raw_sql)
-    if not parsed.find(exp.Select):
+    raw_sql = load_query_template(query_path).render(parameters)
+    if not is_select_query(raw_sql):
         raise ValueError("Only SELECT queries allowed")
     return raw_sql
@@ -0,0 +1,199 @@
+"""Utils to write rows into BigQuery through the Storage Write API."""
+
+import json
+from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import batched
+from typing import Any, Callable, Iterable
+
+import pandas as pd
+from google.cloud import bigquery
+from google.cloud.bigquery_storage_v1 import BigQueryWriteClient, types, writer
+from google.protobuf import descriptor_pb2, descriptor_pool, message_factory
+
+APPEND_BATCH_SIZE = 500
+
+PROTO_TYPES = {
+    "STRING": descriptor_pb2.FieldDescriptorProto.TYPE_STRING,
+    "INTEGER": descriptor_pb2.FieldDescriptorProto.TYPE_INT64,
+    "INT64": descriptor_pb2.FieldDescriptorProto.TYPE_INT64,
+    "FLOAT": descriptor_pb2.FieldDescriptorProto.TYPE_DOUBLE,
+    "FLOAT64": descriptor_pb2.FieldDescriptorProto.TYPE_DOUBLE,
+    "BOOLEAN": descriptor_pb2.FieldDescriptorProto.TYPE_BOOL,
+    "BOOL": descriptor_pb2.FieldDescriptorProto.TYPE_BOOL,
+    # The Storage Write API expects timestamps as microseconds since epoch.
+    "TIMESTAMP": descriptor_pb2.FieldDescriptorProto.TYPE_INT64,
+}
+
+
+def to_epoch_micros(value: Any) -> int:
+    """Converts a timestamp like value to microseconds since epoch.
+
+    Naive datetimes are treated as UTC, matching how BigQuery loads them.
+    Integers are assumed to already be microseconds since epoch.
+    """
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if isinstance(value, pd.Timestamp):
+        value = value.to_pydatetime()
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    delta = value - datetime(1970, 1, 1, tzinfo=timezone.utc)
+    return (delta.days * 86_400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+VALUE_CONVERTERS: dict[str, Callable[[Any], Any]] = {
+    "STRING": str,
+    "INTEGER": int,
+    "INT64": int,
+    "FLOAT": float,
+    "FLOAT64": float,
+    "BOOLEAN": bool,
+    "BOOL": bool,
+    "TIMESTAMP": to_epoch_micros,
+}
+
+
+@lru_cache(maxsize=64)
+def build_row_message_class(schema: tuple[bigquery.SchemaField, ...]) -> type:
+    """Builds a protobuf message class matching a BigQuery table schema.
+
+    The class is cached per schema, so every upload to the same table reuses it.
+
+    Args:
+        schema: BigQuery schema of the destination table.
+
+    Returns:
+        Protobuf message class with one field per schema field.
+
+    Raises:
+        ValueError: If a field has a type the Storage Write path does not support.
+    """
+    file_proto = descriptor_pb2.FileDescriptorProto(
+        name="row.proto", package="fitnessllm", syntax="proto2"
+    )
+    message_proto = file_proto.message_type.add(name="Row")
+    for number, field in enumerate(schema, start=1):
+        if field.field_type not in PROTO_TYPES:
+            raise ValueError(
+                f"Unsupported type {field.field_type} for column {field.name}"
+            )
+        message_proto.field.add(
+            name=field.name,
+            number=number,
+            type=PROTO_TYPES[field.field_type],
+            label=(
+                descriptor_pb2.FieldDescriptorProto.LABEL_REQUIRED
+                if field.mode == "REQUIRED"
+                else descriptor_pb2.FieldDescriptorProto.LABEL_OPTIONAL
+            ),
+        )
+    pool = descriptor_pool.DescriptorPool()
+    pool.Add(file_proto)
+    return message_factory.GetMessageClass(pool.FindMessageTypeByName("fitnessllm.Row"))
+
+
+def serialize_row(
+    row: dict, schema: list[bigquery.SchemaField], message_class: type
+) -> bytes:
+    """Serializes a row into protobuf bytes, skipping nulls.
+
+    Lists and dicts are written to STRING columns as JSON.
+
+    Raises:
+        ValueError: If the row has columns missing from the schema, or a list
+            or dict value for a column that is not a STRING.
+    """
+    unknown_columns = row.keys() - message_class.DESCRIPTOR.fields_by_name.keys()
+    if unknown_columns:
+        raise ValueError(f"Columns not in table schema: {sorted(unknown_columns)}")
+    message = message_class()
+    for field in schema:
+        value = row.get(field.name)
+        if isinstance(value, (list, dict)):
+            if field.field_type != "STRING":
+                raise ValueError(
+                    f"Cannot write {type(value).__name__} to {field.field_type} column {field.name}"
+                )
+            value = json.dumps(value)
+        elif value is None or pd.isna(value):
+            continue
+        setattr(message, field.name, VALUE_CONVERTERS[field.field_type](value))
+    return message.SerializeToString()
+
+
+def append_rows(
+    write_client: BigQueryWriteClient,
+    table: bigquery.TableReference,
+    schema: list[bigquery.SchemaField],
+    rows: Iterable[dict],
+    batch_size: int = APPEND_BATCH_SIZE,
+) -> int:
+    """Appends rows to a table through a pending write stream.
+
+    Rows only become visible once every batch has been acknowledged and the
+    stream is committed, so a failure leaves the table untouched.
+
+    Args:
+        write_client: BigQuery Storage Write client.
+        table: Destination table.
+        schema: BigQuery schema of the destination table.
+        rows: Rows to write, as dicts keyed by column name.
+        batch_size: Number of rows sent per append request.
+
+    Returns:
+        Number of rows written.
+
+    Raises:
+        RuntimeError: If the write stream could not be committed.
+    """
+    parent = write_client.table_path(table.project, table.dataset_id, table.table_id)
+    write_stream = write_client.create_write_stream(
+        parent=parent,
+        write_stream=types.WriteStream(type_=types.WriteStream.Type.PENDING),
+    )
+    message_class = build_row_message_class(tuple(schema))
+    proto_descriptor = descriptor_pb2.DescriptorProto()
+    message_class.DESCRIPTOR.CopyToProto(proto_descriptor)
+    request_template = types.AppendRowsRequest(
+        write_stream=write_stream.name,
+        proto_rows=types.AppendRowsRequest.ProtoData(
+            writer_schema=types.ProtoSchema(proto_descriptor=proto_descriptor)
+        ),
+    )
+    append_rows_stream = writer.AppendRowsStream(write_client, request_template)
+
+    offset = 0
+    futures = []
+    try:
+        for batch in batched(rows, batch_size):
+            proto_rows = types.ProtoRows(
+                serialized_rows=[
+                    serialize_row(row, schema, message_class) for row in batch
+                ]
+            )
+            futures.append(
+                append_rows_stream.send(
+                    types.AppendRowsRequest(
+                        offset=offset,
+                        proto_rows=types.AppendRowsRequest.ProtoData(rows=proto_rows),
+                    )
+                )
+            )
+            offset += len(batch)
+        for future in futures:
+            future.result()
+    finally:
+        append_rows_stream.close()
+
+    write_client.finalize_write_stream(name=write_stream.name)
+    response = write_client.batch_commit_write_streams(
+        types.BatchCommitWriteStreamsRequest(
+            parent=parent, write_streams=[write_stream.name]
+        )
+    )
+    if response.stream_errors:
+        raise RuntimeError(f"Failed to commit write stream: {response.stream_errors}")
+    return offset
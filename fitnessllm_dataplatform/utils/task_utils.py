@@ -4,6 +4,7 @@ import json
 import os
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from json.decoder import JSONDecodeError
 from typing import Optional
 
@@ -31,9 +32,12 @@ def load_into_env_vars(options: dict):
 
 def get_enum_values_from_list(enum: list[Enum]):
     """Returns a list of values from an Enum list."""
-    if not all(isinstance(item, Enum) for item in enum):
-        raise TypeError("All items in the list must be Enum instances")
-    return [member.value for member in enum]
+    values = []
+    for member in enum:
+        if not isinstance(member, Enum):
+            raise TypeError("All items in the list must be Enum instances")
+        values.append(member.value)
+    return values
 
 
 def dataclass_convertor(data):
@@ -62,6 +66,33 @@ def get_schema_path(
     return "fitnessllm_dataplatform/schemas/metrics.json"
 
 
+@lru_cache(maxsize=64)
+def _read_schema(schema_path: str) -> tuple[bigquery.SchemaField, ...]:
+    """Reads and validates a schema file, cached per path."""
+    with open(schema_path) as f:
+        schema_json = json.load(f)
+
+    required_fields = {"name", "type"}
+    for field in schema_json:
+        if not isinstance(field, dict):
+            raise ValueError(f"Invalid field in schema: {field}")
+        missing_fields = required_fields - set(field.keys())
+        if missing_fields:
+            raise ValueError(
+                f"Missing required fields {missing_fields} in field: {field}"
+            )
+
+    return tuple(
+        bigquery.SchemaField(
+            name=field["name"],
+            field_type=field["type"],
+            mode=field.get("mode", "NULLABLE"),
+            description=field.get("description", ""),
+        )
+        for field in schema_json
+    )
+
+
 @beartype
 def load_schema_from_json(
     data_source: Optional[FitnessLLMDataSource],
@@ -70,8 +101,7 @@ def load_schema_from_json(
     """Loads schema from JSON file."""
     schema_path = get_schema_path(data_source, data_stream)
     try:
-        with open(schema_path) as f:
-            schema_json = json.load(f)
+        return list(_read_schema(schema_path))
     except FileNotFoundError:
         structured_logger.error(
             message="File not found",
@@ -88,23 +118,3 @@ def load_schema_from_json(
             data_stream=getattr(data_stream, "value", None),
         )
         raise
-
-    required_fields = {"name", "type"}
-    for field in schema_json:
-        if not isinstance(field, dict):
-            raise ValueError(f"Invalid field in schema: {field}")
-        missing_fields = required_fields - set(field.keys())
-        if missing_fields:
-            raise ValueError(
-                f"Missing required fields {missing_fields} in field: {field}"
-            )
-
-    return [
-        bigquery.SchemaField(
-            name=field["name"],
-            field_type=field["type"],
-            mode=field.get("mode", "NULLABLE"),
-            description=field.get("description", ""),
-        )
-        for field in schema_json
-    ]
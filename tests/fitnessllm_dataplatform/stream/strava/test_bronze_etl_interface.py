@@ -0,0 +1,112 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+from pandas import DataFrame
+
+from fitnessllm_dataplatform.entities.dataclasses import Metrics
+from fitnessllm_dataplatform.entities.enums import FitnessLLMDataSource, Status
+from fitnessllm_dataplatform.stream.strava.entities.enums import StravaStreams
+from fitnessllm_dataplatform.stream.strava.services.bronze_etl_interface import (
+    BronzeStravaETLInterface,
+)
+
+MODULE = "fitnessllm_dataplatform.stream.strava.services.bronze_etl_interface"
+
+
+@pytest.fixture
+def write_client():
+    with patch(f"{MODULE}.BigQueryWriteClient") as mock_write_client:
+        client = mock_write_client.return_value
+        client.table_path.side_effect = lambda *parts: "/".join(parts)
+        client.create_write_stream.return_value.name = "stream"
+        client.batch_commit_write_streams.return_value.stream_errors = []
+        yield client
+
+
+@pytest.fixture
+def append_rows_stream():
+    with patch(
+        "fitnessllm_dataplatform.utils.storage_write_utils.writer.AppendRowsStream"
+    ) as mock_append_rows_stream:
+        yield mock_append_rows_stream.return_value
+
+
+@pytest.fixture
+def interface(write_client, append_rows_stream):
+    with patch(
+        "fitnessllm_dataplatform.services.etl_interface.get_bigquery_client"
+    ) as mock_client:
+        mock_client.return_value.project = "p"
+        yield BronzeStravaETLInterface(
+            uid="u1", infrastructure_names=MagicMock(), athlete_id="1"
+        )
+
+
+def upsert_time(interface):
+    dataframe = DataFrame(
+        {
+            "data": [1.0, 2.0],
+            "index": [0, 1],
+            "original_size": [2, 2],
+            "series_type": ["time", "time"],
+            "athlete_id": ["1", "1"],
+            "activity_id": ["10", "10"],
+        }
+    )
+    metrics = Metrics(
+        athlete_id="1",
+        activity_id="10",
+        data_source=FitnessLLMDataSource.STRAVA,
+        data_stream=StravaStreams.TIME,
+        record_count=2,
+    )
+    interface.upsert_to_bigquery(
+        stream=StravaStreams.TIME, dataframes=[dataframe], metrics=[metrics]
+    )
+
+
+def test_upsert_to_bigquery(interface, write_client, append_rows_stream):
+    """Rows go through a committed pending stream, and success metrics are queued."""
+    upsert_time(interface)
+
+    write_client.table_path.assert_called_once_with(
+        "p", f"{interface.ENV}_bronze_strava", "time"
+    )
+    request = append_rows_stream.send.call_args.args[0]
+    assert len(request.proto_rows.rows.serialized_rows) == 2
+    write_client.batch_commit_write_streams.assert_called_once()
+    [queued] = interface._pending_metrics[f"p.{interface.ENV}_metrics.metrics"]
+    assert queued["status"] == Status.SUCCESS.value
+
+
+def test_upsert_to_bigquery_failure(interface, write_client, append_rows_stream):
+    """A failed append is not committed, and failure metrics are queued."""
+    append_rows_stream.send.return_value.result.side_effect = Exception("failed")
+
+    upsert_time(interface)
+
+    write_client.batch_commit_write_streams.assert_not_called()
+    [queued] = interface._pending_metrics["dev_metrics.metrics"]
+    assert queued["status"] == Status.FAILURE.value
+
+
+def test_flush_metrics(interface, write_client, append_rows_stream):
+    """Queued metrics are written once per destination and then cleared."""
+    upsert_time(interface)
+    write_client.reset_mock()
+
+    interface.flush_metrics()
+
+    write_client.table_path.assert_called_once_with(
+        "p", f"{interface.ENV}_metrics", "metrics"
+    )
+    write_client.batch_commit_write_streams.assert_called_once()
+    assert not interface._pending_metrics
+
+
+def test_flush_metrics_error(interface, write_client):
+    upsert_time(interface)
+    write_client.batch_commit_write_streams.return_value.stream_errors = ["error"]
+
+    with pytest.raises(RuntimeError, match="Failed to commit write stream"):
+        interface.flush_metrics()
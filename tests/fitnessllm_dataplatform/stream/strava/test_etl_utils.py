@@ -0,0 +1,35 @@
+import pandas as pd
+import pytest
+
+from fitnessllm_dataplatform.stream.strava.etl_utils import flatten_json
+
+RECORDS = [
+    {"id": 1, "name": "Morning Ride"},
+    {
+        "id": 1,
+        "athlete": {"id": 2, "resource_state": 1},
+        "map": {"id": "a1", "summary_polyline": "abc", "resource_state": 2},
+        "distance": 1000.5,
+    },
+    {"a": {"b": {"c": 1, "d": {"e": None}}, "f": 2}, "g": 3},
+    {"id": 1, "empty": {}, "after": 2},
+    {
+        "id": 1,
+        "bikes": [{"id": "b1", "primary": True}],
+        "start_latlng": [1.0, 2.0],
+        "nested": {"items": [{"x": 1}], "count": 1},
+    },
+    {"nested": {"value": None}, "flag": False},
+]
+
+
+@pytest.mark.parametrize("record", RECORDS)
+@pytest.mark.parametrize("separator", [".", "_"])
+def test_flatten_json_matches_json_normalize(record, separator):
+    """Keys, ordering and values match pd.json_normalize for a single record."""
+    expected = pd.json_normalize(record, sep=separator).to_dict(orient="records")[0]
+
+    flat = flatten_json(record, separator=separator)
+
+    assert list(flat) == list(expected)
+    assert flat == expected
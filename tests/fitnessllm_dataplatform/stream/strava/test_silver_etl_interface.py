@@ -0,0 +1,39 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from fitnessllm_dataplatform.stream.strava.services.silver_etl_interface import (
+    SilverStravaETLInterface,
+)
+
+MODULE = "fitnessllm_dataplatform.stream.strava.services.silver_etl_interface"
+
+
+@pytest.fixture
+def interface():
+    with patch("fitnessllm_dataplatform.services.etl_interface.get_bigquery_client"):
+        yield SilverStravaETLInterface(uid="all", athlete_ids=["1", "2"])
+
+
+@patch(f"{MODULE}.MAX_CONCURRENT_JOBS", 3)
+@patch(f"{MODULE}.discover_silver_queries")
+def test_task_handler_submit_error(mock_discover, interface):
+    """Jobs submitted before a failed submission are still awaited."""
+    mock_discover.return_value = ["a.sql", "b.sql", "c.sql"]
+    error = RuntimeError("submit failed")
+    jobs = {"a.sql": MagicMock(), "c.sql": MagicMock()}
+
+    def submit(path, parameters, query):
+        if query == "b.sql":
+            raise error
+        return jobs[query]
+
+    with (
+        patch.object(interface, "silver_etl", side_effect=submit),
+        pytest.raises(RuntimeError) as exc_info,
+    ):
+        interface.task_handler()
+
+    assert exc_info.value is error
+    for job in jobs.values():
+        job.result.assert_called_once()
@@ -0,0 +1,120 @@
+from unittest.mock import patch
+
+import pytest
+
+from fitnessllm_dataplatform.task_handler import ProcessUser
+
+UIDS = ["u1", "u2", "u3"]
+
+
+def fake_init(self, uid, data_source):
+    self.uid = uid
+
+
+@pytest.fixture
+def batch_mocks():
+    """Patches the per-user ETL steps and the shared setup of ProcessUser.batch."""
+    with (
+        patch.dict(
+            "os.environ",
+            {
+                "INFRASTRUCTURE_SECRET": "infra",
+                "ENCRYPTION_SECRET": "enc",
+                "STAGE": "dev",
+            },
+        ),
+        patch("fitnessllm_dataplatform.task_handler.get_infrastructure_names"),
+        patch("fitnessllm_dataplatform.task_handler.get_secret"),
+        patch("fitnessllm_dataplatform.task_handler.create_gs_client"),
+        patch.object(ProcessUser, "__init__", fake_init),
+        patch.object(ProcessUser, "ingest", autospec=True) as ingest,
+        patch.object(ProcessUser, "bronze_etl", autospec=True) as bronze_etl,
+        patch.object(
+            ProcessUser,
+            "get_strava_athlete_id",
+            autospec=True,
+            side_effect=lambda self: f"athlete_{self.uid}",
+        ),
+        patch(
+            "fitnessllm_dataplatform.stream.strava.services.silver_etl_interface.SilverStravaETLInterface"
+        ) as silver,
+    ):
+        yield ingest, bronze_etl, silver
+
+
+def fail_for(uid, error):
+    def step(self, *args, **kwargs):
+        if self.uid == uid:
+            raise error
+
+    return step
+
+
+def test_batch(batch_mocks):
+    """Every user is ingested and converted, then silver runs once for all."""
+    ingest, bronze_etl, silver = batch_mocks
+
+    ProcessUser.batch(uids=UIDS, data_source="STRAVA")
+
+    assert sorted(call.args[0].uid for call in ingest.call_args_list) == UIDS
+    assert [call.args[0].uid for call in bronze_etl.call_args_list] == UIDS
+    silver.assert_called_once_with(
+        uid="all", athlete_ids=["athlete_u1", "athlete_u2", "athlete_u3"]
+    )
+    silver.return_value.task_handler.assert_called_once()
+
+
+def test_batch_bronze_failure(batch_mocks):
+    """A user failing bronze is left out of silver, and its error is raised."""
+    ingest, bronze_etl, silver = batch_mocks
+    error = RuntimeError("bronze failed")
+    bronze_etl.side_effect = fail_for("u2", error)
+
+    with pytest.raises(RuntimeError) as exc_info:
+        ProcessUser.batch(uids=UIDS, data_source="STRAVA")
+
+    assert exc_info.value is error
+    assert [call.args[0].uid for call in bronze_etl.call_args_list] == UIDS
+    silver.assert_called_once_with(uid="all", athlete_ids=["athlete_u1", "athlete_u3"])
+
+
+def test_batch_silver_failure(batch_mocks):
+    """A failed silver rebuild is raised once every user has been converted."""
+    ingest, bronze_etl, silver = batch_mocks
+    error = RuntimeError("silver failed")
+    silver.return_value.task_handler.side_effect = error
+
+    with pytest.raises(RuntimeError) as exc_info:
+        ProcessUser.batch(uids=UIDS, data_source="STRAVA")
+
+    assert exc_info.value is error
+    assert bronze_etl.call_count == len(UIDS)
+
+
+def test_batch_raises_first_error(batch_mocks):
+    """Only the first error is raised, after every step has run."""
+    ingest, bronze_etl, silver = batch_mocks
+    ingest_error = RuntimeError("ingest failed")
+    ingest.side_effect = fail_for("u1", ingest_error)
+    bronze_etl.side_effect = fail_for("u2", ValueError("bronze failed"))
+    silver.return_value.task_handler.side_effect = RuntimeError("silver failed")
+
+    with pytest.raises(RuntimeError) as exc_info:
+        ProcessUser.batch(uids=UIDS, data_source="STRAVA")
+
+    assert exc_info.value is ingest_error
+    assert [call.args[0].uid for call in bronze_etl.call_args_list] == ["u2", "u3"]
+    silver.assert_called_once_with(uid="all", athlete_ids=["athlete_u3"])
+
+
+@pytest.mark.parametrize(
+    "options",
+    [{"data_source": "STRAVA", "phase": "unknown"}, {"data_source": "GARMIN"}],
+)
+def test_batch_unsupported(batch_mocks, options):
+    ingest, bronze_etl, silver = batch_mocks
+
+    with pytest.raises(ValueError):
+        ProcessUser.batch(uids=UIDS, **options)
+
+    ingest.assert_not_called()
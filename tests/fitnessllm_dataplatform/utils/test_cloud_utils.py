@@ -3,14 +3,30 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 from cloudpathlib import CloudPath
+from google.auth.credentials import AnonymousCredentials
+from google.auth.transport.requests import AuthorizedSession
 
 from fitnessllm_dataplatform.utils.cloud_utils import (
+    create_gs_client,
     create_resource_path,
+    create_secret_manager_client,
     get_secret,
     write_json_to_storage,
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_client_caches():
+    """Secrets and clients are cached per process, so reset them per test."""
+    create_secret_manager_client.cache_clear()
+    get_secret.cache_clear()
+    create_gs_client.cache_clear()
+    yield
+    create_secret_manager_client.cache_clear()
+    get_secret.cache_clear()
+    create_gs_client.cache_clear()
+
+
 def test_create_resource_path():
     project_id = "test_project"
     service = "test_service"
@@ -19,6 +35,18 @@ def test_create_resource_path():
     assert create_resource_path(project_id, service, name) == expected_path
 
 
+@patch("fitnessllm_dataplatform.utils.cloud_utils.google.auth.default")
+def test_create_gs_client(mock_default):
+    """The storage client uses a session whose pool fits pool_size threads."""
+    mock_default.return_value = (AnonymousCredentials(), "test_project")
+
+    client = create_gs_client(pool_size=32)
+
+    session = client.client._http
+    assert isinstance(session, AuthorizedSession)
+    assert session.get_adapter("https://storage.googleapis.com")._pool_maxsize == 32
+
+
 @patch.dict("os.environ", {"PROJECT_ID": "test_project"})
 @patch(
     "fitnessllm_dataplatform.utils.cloud_utils.secretmanager.SecretManagerServiceClient"
@@ -0,0 +1,43 @@
+import pytest
+
+from fitnessllm_dataplatform.utils.query_utils import (
+    get_merge_query,
+    get_parameterized_query,
+)
+
+
+@pytest.fixture
+def query_path(tmp_path):
+    path = tmp_path / "stream.sql"
+    path.write_text(
+        "select athlete_id, activity_id from {{ schema }}.time "
+        "where athlete_id in unnest(@athlete_ids)"
+    )
+    return path
+
+
+def test_get_merge_query(query_path):
+    """The MERGE inserts every source row and deletes only the batch's rows."""
+    query = get_merge_query(
+        target_table="dev_silver_strava.stream",
+        query_path=query_path,
+        parameters={"schema": "dev_bronze_strava"},
+    )
+
+    assert " ".join(query.split()) == (
+        "MERGE dev_silver_strava.stream T "
+        "USING (select athlete_id, activity_id from dev_bronze_strava.time "
+        "where athlete_id in unnest(@athlete_ids)) S "
+        "ON FALSE "
+        "WHEN NOT MATCHED THEN INSERT ROW "
+        "WHEN NOT MATCHED BY SOURCE AND T.athlete_id IN UNNEST(@athlete_ids) "
+        "THEN DELETE;"
+    )
+
+
+def test_get_parameterized_query_not_select(tmp_path):
+    path = tmp_path / "delete.sql"
+    path.write_text("delete from {{ schema }}.time where true")
+
+    with pytest.raises(ValueError, match="Only SELECT queries allowed"):
+        get_parameterized_query(query_path=path, parameters={"schema": "bronze"})
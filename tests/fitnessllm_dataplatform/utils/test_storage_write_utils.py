@@ -0,0 +1,172 @@
+import json
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+from google.cloud import bigquery
+
+from fitnessllm_dataplatform.utils.storage_write_utils import (
+    append_rows,
+    build_row_message_class,
+    serialize_row,
+    to_epoch_micros,
+)
+
+SCHEMA = [
+    bigquery.SchemaField("athlete_id", "STRING", mode="REQUIRED"),
+    bigquery.SchemaField("bikes", "STRING"),
+    bigquery.SchemaField("record_count", "INTEGER"),
+    bigquery.SchemaField("data", "FLOAT"),
+    bigquery.SchemaField("premium", "BOOLEAN"),
+    bigquery.SchemaField("metadata_insert_timestamp", "TIMESTAMP"),
+]
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        datetime(2024, 1, 2, 3, 4, 5, 6),
+        datetime(2024, 1, 2, 3, 4, 5, 6, tzinfo=timezone.utc),
+        pd.Timestamp("2024-01-02 03:04:05.000006"),
+        "2024-01-02T03:04:05.000006",
+        1704164645000006,
+    ],
+)
+def test_to_epoch_micros(value):
+    """Naive and aware timestamps map to the same UTC microseconds."""
+    assert to_epoch_micros(value) == 1704164645000006
+
+
+def test_build_row_message_class():
+    """The message class has one field per schema field and is cached."""
+    message_class = build_row_message_class(tuple(SCHEMA))
+
+    assert [field.name for field in message_class.DESCRIPTOR.fields] == [
+        field.name for field in SCHEMA
+    ]
+    assert build_row_message_class(tuple(SCHEMA)) is message_class
+
+
+def test_build_row_message_class_unsupported_type():
+    schema = (bigquery.SchemaField("location", "GEOGRAPHY"),)
+
+    with pytest.raises(ValueError, match="GEOGRAPHY for column location"):
+        build_row_message_class(schema)
+
+
+def test_serialize_row():
+    """Values are converted per column type, and nulls are left unset."""
+    message_class = build_row_message_class(tuple(SCHEMA))
+    row = {
+        "athlete_id": 123,
+        "bikes": None,
+        "record_count": 5,
+        "data": float("nan"),
+        "premium": True,
+        "metadata_insert_timestamp": datetime(2024, 1, 2, 3, 4, 5, 6),
+    }
+
+    message = message_class.FromString(serialize_row(row, SCHEMA, message_class))
+
+    assert message.athlete_id == "123"
+    assert not message.HasField("bikes")
+    assert message.record_count == 5
+    assert not message.HasField("data")
+    assert message.premium is True
+    assert message.metadata_insert_timestamp == 1704164645000006
+
+
+def test_serialize_row_json_string():
+    """Lists and dicts in STRING columns are written as JSON."""
+    message_class = build_row_message_class(tuple(SCHEMA))
+    bikes = [{"id": "b1", "primary": True}]
+
+    message = message_class.FromString(
+        serialize_row({"athlete_id": "1", "bikes": bikes}, SCHEMA, message_class)
+    )
+
+    assert json.loads(message.bikes) == bikes
+
+
+def test_serialize_row_nested_non_string():
+    message_class = build_row_message_class(tuple(SCHEMA))
+
+    with pytest.raises(ValueError, match="record_count"):
+        serialize_row({"athlete_id": "1", "record_count": [1]}, SCHEMA, message_class)
+
+
+def test_serialize_row_unknown_column():
+    message_class = build_row_message_class(tuple(SCHEMA))
+
+    with pytest.raises(ValueError, match="unknown"):
+        serialize_row({"athlete_id": "1", "unknown": 1}, SCHEMA, message_class)
+
+
+@pytest.fixture
+def write_client():
+    client = MagicMock()
+    client.table_path.return_value = "projects/p/datasets/d/tables/t"
+    client.create_write_stream.return_value.name = "stream"
+    client.batch_commit_write_streams.return_value.stream_errors = []
+    return client
+
+
+@patch("fitnessllm_dataplatform.utils.storage_write_utils.writer.AppendRowsStream")
+def test_append_rows(mock_append_rows_stream, write_client):
+    """Batches are sent at increasing offsets, then the stream is committed."""
+    rows = [{"athlete_id": str(i)} for i in range(5)]
+
+    written = append_rows(
+        write_client=write_client,
+        table=bigquery.TableReference.from_string("p.d.t"),
+        schema=SCHEMA,
+        rows=rows,
+        batch_size=2,
+    )
+
+    assert written == 5
+    stream = mock_append_rows_stream.return_value
+    requests = [call.args[0] for call in stream.send.call_args_list]
+    assert [request.offset for request in requests] == [0, 2, 4]
+    assert [len(request.proto_rows.rows.serialized_rows) for request in requests] == [
+        2,
+        2,
+        1,
+    ]
+    assert stream.send.return_value.result.call_count == 3
+    stream.close.assert_called_once()
+    write_client.finalize_write_stream.assert_called_once_with(name="stream")
+    commit_request = write_client.batch_commit_write_streams.call_args.args[0]
+    assert list(commit_request.write_streams) == ["stream"]
+
+
+@patch("fitnessllm_dataplatform.utils.storage_write_utils.writer.AppendRowsStream")
+def test_append_rows_commit_error(mock_append_rows_stream, write_client):
+    write_client.batch_commit_write_streams.return_value.stream_errors = ["error"]
+
+    with pytest.raises(RuntimeError, match="Failed to commit write stream"):
+        append_rows(
+            write_client=write_client,
+            table=bigquery.TableReference.from_string("p.d.t"),
+            schema=SCHEMA,
+            rows=[{"athlete_id": "1"}],
+        )
+
+
+@patch("fitnessllm_dataplatform.utils.storage_write_utils.writer.AppendRowsStream")
+def test_append_rows_send_error(mock_append_rows_stream, write_client):
+    """A failed batch closes the stream and leaves it uncommitted."""
+    stream = mock_append_rows_stream.return_value
+    stream.send.return_value.result.side_effect = Exception("append failed")
+
+    with pytest.raises(Exception, match="append failed"):
+        append_rows(
+            write_client=write_client,
+            table=bigquery.TableReference.from_string("p.d.t"),
+            schema=SCHEMA,
+            rows=[{"athlete_id": "1"}],
+        )
+
+    stream.close.assert_called_once()
+    write_client.batch_commit_write_streams.assert_not_called()